@@ -1,28 +1,59 @@
 """OnRobot gripper control via XML-RPC API."""
 
-from onrobot.detection import DetectedGripper, detect_gripper, detect_gripper_type
-from onrobot.device import Device
-from onrobot.dimensions import GripperDimensions, get_static_dimensions
-from onrobot.rg2 import RG
-from onrobot.sg import SG
-from onrobot.status_client import OnRobotStatusClient
-from onrobot.twofg import TWOFG
-from onrobot.vgc10 import VG
-from onrobot.gripper_profiles import (
-    DEFAULT_GRIPPER_TYPE,
-    GripperProfile,
-    get_gripper_profile,
-    gripper_profile_options,
-)
-from onrobot.errors import (
-    OnRobotError,
-    OnRobotConnectionError,
-    OnRobotTimeoutError,
-    OnRobotValidationError,
-)
-from onrobot.policies import OperationPolicy
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from onrobot.detection import DetectedGripper, detect_gripper, detect_gripper_type
+    from onrobot.device import Device
+    from onrobot.dimensions import GripperDimensions, get_static_dimensions
+    from onrobot.errors import (
+        OnRobotConnectionError,
+        OnRobotError,
+        OnRobotTimeoutError,
+        OnRobotValidationError,
+    )
+    from onrobot.gripper_profiles import (
+        DEFAULT_GRIPPER_TYPE,
+        GripperProfile,
+        get_gripper_profile,
+        gripper_profile_options,
+    )
+    from onrobot.policies import OperationPolicy
+    from onrobot.rg2 import RG
+    from onrobot.sg import SG
+    from onrobot.status_client import OnRobotStatusClient
+    from onrobot.twofg import TWOFG
+    from onrobot.vgc10 import VG
 
 __version__ = "0.1.0"
+
+# Public name -> defining submodule; resolved on first attribute access (PEP 562).
+_LAZY_EXPORTS: dict[str, str] = {
+    "Device": "onrobot.device",
+    "RG": "onrobot.rg2",
+    "SG": "onrobot.sg",
+    "TWOFG": "onrobot.twofg",
+    "VG": "onrobot.vgc10",
+    "OnRobotStatusClient": "onrobot.status_client",
+    "DetectedGripper": "onrobot.detection",
+    "GripperDimensions": "onrobot.dimensions",
+    "GripperProfile": "onrobot.gripper_profiles",
+    "OperationPolicy": "onrobot.policies",
+    "OnRobotError": "onrobot.errors",
+    "OnRobotConnectionError": "onrobot.errors",
+    "OnRobotTimeoutError": "onrobot.errors",
+    "OnRobotValidationError": "onrobot.errors",
+    "DEFAULT_GRIPPER_TYPE": "onrobot.gripper_profiles",
+    "detect_gripper": "onrobot.detection",
+    "detect_gripper_type": "onrobot.detection",
+    "get_gripper_profile": "onrobot.gripper_profiles",
+    "get_static_dimensions": "onrobot.dimensions",
+    "gripper_profile_options": "onrobot.gripper_profiles",
+}
+
 __all__ = [
     "Device",
     "RG",
@@ -45,3 +76,16 @@ __all__ = [
     "get_static_dimensions",
     "gripper_profile_options",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
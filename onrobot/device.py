@@ -10,18 +10,45 @@ from onrobot.errors import OnRobotConnectionError
 LOGGER = logging.getLogger(__name__)
 
 
+class TimeoutTransport(xmlrpc.client.Transport):
+    """XML-RPC transport whose socket operations give up after *timeout_s*.
+
+    The stock transport blocks forever when the Compute Box stops answering.
+    Connection reuse and the reconnect-once-on-reset retry come from the
+    stdlib ``Transport`` unchanged.
+    """
+
+    def __init__(self, timeout_s: float | None = None, **kwargs):
+        super().__init__(**kwargs)
+        self.timeout_s = timeout_s
+
+    def make_connection(self, host):
+        connection = super().make_connection(host)
+        if self.timeout_s is not None:
+            connection.timeout = self.timeout_s
+        return connection
+
+
 class Device:
     """Generic Compute Box device connection wrapper."""
 
     cb = None
 
-    def __init__(self, Global_cbip: str = "192.168.1.1"):  # noqa: N803
+    def __init__(
+        self,
+        Global_cbip: str = "192.168.1.1",  # noqa: N803
+        rpc_timeout_s: float | None = None,
+    ):
         self.Global_cbip = Global_cbip
+        self.rpc_timeout_s = rpc_timeout_s
 
     def get_compute_box(self):
         """Return XML-RPC proxy to the configured Compute Box."""
         try:
-            self.cb = xmlrpc.client.ServerProxy(f"http://{self.Global_cbip}:41414/")
+            self.cb = xmlrpc.client.ServerProxy(
+                f"http://{self.Global_cbip}:41414/",
+                transport=TimeoutTransport(self.rpc_timeout_s),
+            )
             return self.cb
         except TimeoutError as exc:
             LOGGER.error("Connection to Compute Box failed for %s", self.Global_cbip)
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from typing import Iterable
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GripperProfile:
     """Describes the tuning bounds used for a specific gripper type."""
 
@@ -114,6 +115,7 @@ _PROFILES: dict[str, GripperProfile] = {
 }
 
 
+@functools.lru_cache(maxsize=32)
 def get_gripper_profile(key: str | None) -> GripperProfile:
     """Return the profile matching *key*, falling back to the default."""
     normalized = (key or "").lower()
@@ -8,6 +8,14 @@ from dataclasses import dataclass
 @dataclass(frozen=True)
 class OperationPolicy:
     poll_interval_s: float = 0.1
+    # 2FG polling starts at poll_initial_s and grows by poll_backoff up to
+    # poll_interval_s, which every client treats as the longest gap between polls.
+    poll_initial_s: float = 0.02
+    poll_backoff: float = 1.5
     busy_timeout_s: float = 3.0
+    # RG only; 2FG reads grip detection in the same poll as busy and needs no
+    # separate detection wait.
     detect_timeout_s: float = 2.0
     vacuum_timeout_s: float = 4.0
+    width_limits_ttl_s: float = 5.0
+    connection_cache_ttl_s: float = 0.5
@@ -17,6 +17,7 @@ from onrobot.errors import (
     OnRobotValidationError,
 )
 from onrobot.policies import OperationPolicy
+from onrobot.status_client import OnRobotStatusClient
 
 LOGGER = logging.getLogger(__name__)
 
@@ -134,8 +135,6 @@ class SG:
         if not self._cb_ip:
             return False
         if self._status_client is None:
-            from onrobot.status_client import OnRobotStatusClient
-
             self._status_client = OnRobotStatusClient(self._cb_ip, on_update=on_update)
         try:
             self._status_client.connect(timeout_s=timeout_s)
@@ -154,7 +153,9 @@ class SG:
         client = self._status_client
         if client is None:
             return None
-        return client.get_device_variable(device_id=t_index, product_code=SG_ID)
+        snapshot = client.get_device_variable(device_id=t_index, product_code=SG_ID)
+        # The client shares its stored dict; hand callers their own copy.
+        return None if snapshot is None else dict(snapshot)
 
     def isConnected(self, t_index=0):  # noqa: N802
         warnings.warn(
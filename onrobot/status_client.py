@@ -1,13 +1,32 @@
 import logging
 import threading
 import time
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from onrobot.errors import OnRobotConnectionError
 
 
 LOGGER = logging.getLogger(__name__)
 
+_socketio = None
+
+
+def _load_socketio():
+    """Import python-socketio on first use so plain RPC users never load it."""
+    global _socketio
+    if _socketio is None:
+        try:
+            import socketio
+        except ModuleNotFoundError as exc:
+            raise OnRobotConnectionError(
+                "python-socketio is required for OnRobotStatusClient"
+            ) from exc
+        _socketio = socketio
+    return _socketio
+
+
+_Waiter = Tuple[int, Optional[int], Callable[[Dict[str, Any]], bool], threading.Event]
+
 
 class OnRobotStatusClient:
     """Listen for Compute Box status updates over Socket.IO."""
@@ -23,17 +42,15 @@ class OnRobotStatusClient:
         self._lock = threading.Lock()
         self._latest: Dict[str, Any] = {}
         self._latest_timestamp: Optional[float] = None
-        try:
-            import socketio
-        except ModuleNotFoundError as exc:
-            raise OnRobotConnectionError(
-                "python-socketio is required for OnRobotStatusClient"
-            ) from exc
+        self._device_index: Dict[Tuple[Any, Any], Dict[str, Any]] = {}
+        self._waiters: List[_Waiter] = []
+        socketio = _load_socketio()
         self._sio = socketio.Client(
             reconnection=True,
             reconnection_attempts=0,
-            reconnection_delay=1.0,
-            reconnection_delay_max=5.0,
+            reconnection_delay=0.2,
+            reconnection_delay_max=1.0,
+            randomization_factor=0.5,
         )
         self._sio.on("message", self._handle_message)
 
@@ -42,7 +59,8 @@ class OnRobotStatusClient:
             return
         self._sio.connect(
             f"http://{self._cb_ip}",
-            transports=["websocket", "polling"],
+            # The Compute Box always serves WebSocket; skip long-polling fallback.
+            transports=["websocket"],
             wait_timeout=timeout_s,
         )
 
@@ -58,8 +76,10 @@ class OnRobotStatusClient:
             return self._latest_timestamp
 
     def latest_payload(self) -> Dict[str, Any]:
-        with self._lock:
-            return dict(self._latest)
+        """Return the latest payload by reference; treat it as read-only."""
+        # Each message replaces ``_latest`` wholesale, so reading the
+        # reference is atomic and needs no lock.
+        return self._latest
 
     def get_device_variable(
         self,
@@ -67,26 +87,86 @@ class OnRobotStatusClient:
         device_id: int = 0,
         product_code: Optional[int] = None,
     ) -> Optional[Dict[str, Any]]:
-        payload = self.latest_payload()
-        devices = payload.get("devices", [])
+        """Return the matching device ``variable`` by reference; treat it as read-only."""
+        return self._lookup_variable(self._device_index, device_id, product_code)
+
+    @staticmethod
+    def _index_devices(payload: Dict[str, Any]) -> Dict[Tuple[Any, Any], Dict[str, Any]]:
+        index: Dict[Tuple[Any, Any], Dict[str, Any]] = {}
+        devices = payload.get("devices")
+        if not isinstance(devices, list):
+            return index
         for device in devices:
-            if device.get("deviceId") != device_id:
-                continue
-            if product_code is not None and device.get("productCode") != product_code:
+            if not isinstance(device, dict):
                 continue
             variable = device.get("variable")
-            if isinstance(variable, dict):
-                return dict(variable)
+            if not isinstance(variable, dict):
+                continue
+            key = (device.get("deviceId"), device.get("productCode"))
+            try:
+                index.setdefault(key, variable)
+            except TypeError:
+                # Unhashable deviceId/productCode; such a device cannot be queried.
+                continue
+        return index
+
+    @staticmethod
+    def _lookup_variable(
+        index: Dict[Tuple[Any, Any], Dict[str, Any]],
+        device_id: int,
+        product_code: Optional[int],
+    ) -> Optional[Dict[str, Any]]:
+        if product_code is not None:
+            return index.get((device_id, product_code))
+        for (indexed_id, _), variable in index.items():
+            if indexed_id == device_id:
+                return variable
         return None
 
+    def register_waiter(
+        self,
+        device_id: int,
+        predicate: Callable[[Dict[str, Any]], bool],
+        event: threading.Event,
+        *,
+        product_code: Optional[int] = None,
+    ) -> None:
+        """Set *event* once a device variable update satisfies *predicate*."""
+        with self._lock:
+            self._waiters.append((device_id, product_code, predicate, event))
+
+    def unregister_waiter(self, event: threading.Event) -> None:
+        with self._lock:
+            self._waiters = [waiter for waiter in self._waiters if waiter[3] is not event]
+
+    def _notify_waiters(self, index: Dict[Tuple[Any, Any], Dict[str, Any]]) -> None:
+        with self._lock:
+            waiters = list(self._waiters)
+        for device_id, product_code, predicate, event in waiters:
+            if event.is_set():
+                continue
+            variable = self._lookup_variable(index, device_id, product_code)
+            if variable is None:
+                continue
+            try:
+                matched = predicate(variable)
+            except Exception:  # noqa: BLE001
+                LOGGER.exception("Status waiter predicate failed")
+                matched = False
+            if matched:
+                event.set()
+
     def _handle_message(self, payload: Any) -> None:
         if not isinstance(payload, dict):
             return
         if "devices" not in payload:
             return
+        index = self._index_devices(payload)
         with self._lock:
             self._latest = payload
+            self._device_index = index
             self._latest_timestamp = time.time()
+        self._notify_waiters(index)
         if self._on_update is not None:
             try:
                 self._on_update(payload)
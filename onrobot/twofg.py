@@ -2,23 +2,25 @@
 
 from __future__ import annotations
 
+import http.client
 import logging
 import threading
 import time
-import urllib.error
-import urllib.request
 import warnings
+import xmlrpc.client
 from typing import Any
 
 from onrobot.device import Device
 from onrobot.errors import (
     OnRobotConnectionError,
+    OnRobotError,
     OnRobotTimeoutError,
     OnRobotValidationError,
 )
 from onrobot.dimensions import get_static_dimensions
 from onrobot.gripper_profiles import get_gripper_profile
 from onrobot.policies import OperationPolicy
+from onrobot.status_client import OnRobotStatusClient
 
 LOGGER = logging.getLogger(__name__)
 
@@ -30,9 +32,37 @@ CONN_ERR = -2
 RET_OK = 0
 RET_FAIL = -1
 
+# XML-RPC fault codes meaning the Compute Box firmware lacks the method.
+_METHOD_NOT_FOUND_FAULTS = frozenset({-32601, 1})
+
+# Failures reaching the Compute Box, as opposed to faults it reports.
+_TRANSPORT_ERRORS = (OSError, http.client.HTTPException, xmlrpc.client.ProtocolError)
+
+_OUTWARD = frozenset({"outward", "out", "outside"})
+_INWARD = frozenset({"inward", "in", "inside"})
+
 GRIPPER_PROFILE = get_gripper_profile("twofg7")
 
 
+class _BusyWatch:
+    """Status-stream watcher for one motion command, registered before it is sent."""
+
+    def __init__(self, client: OnRobotStatusClient, t_index: int) -> None:
+        self._client = client
+        self.seen_busy = False
+        self.idle = threading.Event()
+        client.register_waiter(t_index, self._on_variable, self.idle, product_code=TWOFG_ID)
+
+    def _on_variable(self, variable) -> bool:
+        if variable.get("busy"):
+            self.seen_busy = True
+            return False
+        return True
+
+    def close(self) -> None:
+        self._client.unregister_waiter(self.idle)
+
+
 class TWOFG:
     """2FG gripper client with typed snake_case API + compatibility wrappers."""
 
@@ -44,8 +74,16 @@ class TWOFG:
         self._lock = threading.Lock()
         self._cb_ip = getattr(dev, "Global_cbip", None)
         self._status_client = None
+        self._http: http.client.HTTPConnection | None = None
         self._profile = GRIPPER_PROFILE
+        self._fmin = float(GRIPPER_PROFILE.force_min)
+        self._fmax = float(GRIPPER_PROFILE.force_max)
+        self._smin = float(GRIPPER_PROFILE.speed_min)
+        self._smax = float(GRIPPER_PROFILE.speed_max)
         self._policy = policy or OperationPolicy()
+        self._width_limits_cache: dict[int, tuple[float, float, float]] = {}
+        self._conn_cache: dict[int, tuple[bool, float]] = {}
+        self._multicall_supported = True
 
     @property
     def profile(self):
@@ -56,39 +94,286 @@ class TWOFG:
             method = getattr(self.cb, method_name)
             return method(*args)
 
+    def _call_xmlrpc_many(self, *calls: tuple[Any, ...]) -> list[Any]:
+        """Run ``(method_name, *args)`` calls back to back under one lock acquisition.
+
+        Faults reported by a call raise OnRobotError and transport failures raise
+        OnRobotConnectionError, matching :meth:`_multicall`.
+        """
+        try:
+            with self._lock:
+                return [getattr(self.cb, name)(*args) for name, *args in calls]
+        except xmlrpc.client.Fault as fault:
+            raise OnRobotError(f"2FG XML-RPC call failed: {fault.faultString}") from fault
+        except _TRANSPORT_ERRORS as exc:
+            raise OnRobotConnectionError("2FG XML-RPC call failed") from exc
+
+    def _multicall(self, *calls: tuple[Any, ...]) -> list[Any] | None:
+        """Run ``(method_name, *args)`` calls in one ``system.multicall`` round trip.
+
+        Returns None when the Compute Box has no ``system.multicall``. Otherwise
+        errors map as in :meth:`_call_xmlrpc_many`: a fault from the batch or any
+        call in it raises OnRobotError, a transport failure OnRobotConnectionError.
+        """
+        if not self._multicall_supported:
+            return None
+        try:
+            with self._lock:
+                multicall = xmlrpc.client.MultiCall(self.cb)
+                for name, *args in calls:
+                    getattr(multicall, name)(*args)
+                results = multicall()
+        except xmlrpc.client.Fault as fault:
+            if fault.faultCode in _METHOD_NOT_FOUND_FAULTS:
+                # Remember the missing system.multicall and use individual calls.
+                self._multicall_supported = False
+                return None
+            raise OnRobotError(f"2FG XML-RPC call failed: {fault.faultString}") from fault
+        except _TRANSPORT_ERRORS as exc:
+            raise OnRobotConnectionError("2FG XML-RPC multicall failed") from exc
+        try:
+            return list(results)
+        except xmlrpc.client.Fault as fault:
+            # A fault from one call in the batch, not from system.multicall itself.
+            raise OnRobotError(f"2FG XML-RPC call failed: {fault.faultString}") from fault
+
     def _call_rest(self, path: str, timeout_s: float = 2.0):
         if not self._cb_ip:
             raise OnRobotConnectionError("Compute Box IP is not configured")
-        url = f"http://{self._cb_ip}/{path.lstrip('/')}"
+        url = "/" + path.lstrip("/")
         with self._lock:
-            request = urllib.request.Request(url, method="GET")
-            with urllib.request.urlopen(request, timeout=timeout_s) as response:
-                return response.read().decode("utf-8")
+            for attempt in range(2):
+                if self._http is None:
+                    self._http = http.client.HTTPConnection(self._cb_ip, timeout=timeout_s)
+                connection = self._http
+                connection.timeout = timeout_s
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout_s)
+                try:
+                    connection.request("GET", url)
+                    response = connection.getresponse()
+                    body = response.read()
+                except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                    # The Compute Box dropped the idle keep-alive socket; reconnect once.
+                    connection.close()
+                    self._http = None
+                    if attempt:
+                        raise
+                    continue
+                except Exception:
+                    connection.close()
+                    self._http = None
+                    raise
+                if response.status >= 400:
+                    raise OnRobotConnectionError(
+                        f"Compute Box REST call failed with HTTP {response.status}"
+                    )
+                return body.decode("utf-8")
+
+    def _get_width_limits(self, t_index: int = 0) -> tuple[float, float]:
+        """Return cached ``(min_width, max_width)``, refreshing once the TTL expires."""
+        now = time.monotonic()
+        cached = self._width_limits_cache.get(t_index)
+        if cached is not None and now < cached[2]:
+            return cached[0], cached[1]
+        min_width, max_width = self._call_xmlrpc_many(
+            ("twofg_get_min_external_width", t_index),
+            ("twofg_get_max_external_width", t_index),
+        )
+        self._width_limits_cache[t_index] = (
+            min_width,
+            max_width,
+            now + self._policy.width_limits_ttl_s,
+        )
+        return min_width, max_width
 
-    def _require_connected(self, t_index: int = 0) -> None:
+    def invalidate_width_cache(self, t_index: int | None = None) -> None:
+        if t_index is None:
+            self._width_limits_cache.clear()
+        else:
+            self._width_limits_cache.pop(t_index, None)
+
+    def invalidate_connection_cache(self, t_index: int | None = None) -> None:
+        if t_index is None:
+            self._conn_cache.clear()
+        else:
+            self._conn_cache.pop(t_index, None)
+
+    def _query_connected(self, t_index: int = 0) -> bool:
+        """Return the connection state, reusing a result younger than the policy TTL."""
+        cached = self._conn_cache.get(t_index)
+        if cached is not None:
+            connected, timestamp = cached
+            if time.monotonic() - timestamp < self._policy.connection_cache_ttl_s:
+                return connected
         try:
             connected = bool(
                 self._call_xmlrpc("cb_is_device_connected", t_index, TWOFG_ID)
             )
+        except Exception:
+            self._conn_cache.pop(t_index, None)
+            raise
+        self._conn_cache[t_index] = (connected, time.monotonic())
+        return connected
+
+    def _require_connected(self, t_index: int = 0) -> None:
+        try:
+            connected = self._query_connected(t_index)
         except Exception as exc:  # noqa: BLE001
             raise OnRobotConnectionError("Failed to query 2FG connection status") from exc
         if not connected:
             raise OnRobotConnectionError("No 2FG device connected on the given index")
 
+    def _prefetch_grip_prereqs(self, t_index: int = 0) -> tuple[float, float]:
+        """Check the connection and return ``(min_width, max_width)`` in one round trip."""
+        now = time.monotonic()
+        conn = self._conn_cache.get(t_index)
+        limits = self._width_limits_cache.get(t_index)
+        conn_fresh = conn is not None and now - conn[1] < self._policy.connection_cache_ttl_s
+        limits_fresh = limits is not None and now < limits[2]
+        if not (conn_fresh and limits_fresh):
+            try:
+                results = self._multicall(
+                    ("cb_is_device_connected", t_index, TWOFG_ID),
+                    ("twofg_get_max_external_width", t_index),
+                    ("twofg_get_min_external_width", t_index),
+                )
+            except OnRobotConnectionError:
+                self._conn_cache.pop(t_index, None)
+                raise
+            except OnRobotError:
+                # A call in the batch faulted. Re-check the connection on its own so a
+                # failing connection query still reports CONN_ERR, as unbatched.
+                self._conn_cache.pop(t_index, None)
+                self._require_connected(t_index)
+                raise
+            if results is not None:
+                connected, max_width, min_width = results
+                self._conn_cache[t_index] = (bool(connected), time.monotonic())
+                if not connected:
+                    raise OnRobotConnectionError("No 2FG device connected on the given index")
+                self._width_limits_cache[t_index] = (
+                    min_width,
+                    max_width,
+                    now + self._policy.width_limits_ttl_s,
+                )
+                return min_width, max_width
+        self._require_connected(t_index)
+        return self._get_width_limits(t_index)
+
     def _wait_until(self, predicate, timeout_s: float, timeout_message: str) -> None:
+        policy = self._policy
+        delay = min(policy.poll_initial_s, policy.poll_interval_s)
         deadline = time.monotonic() + timeout_s
-        while time.monotonic() < deadline:
+        while True:
             if predicate():
                 return
-            time.sleep(self._policy.poll_interval_s)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * policy.poll_backoff, policy.poll_interval_s)
         raise OnRobotTimeoutError(timeout_message)
 
+    def _watch_busy(self, t_index: int) -> _BusyWatch | None:
+        client = self._status_client
+        if client is None or not client.is_connected():
+            return None
+        return _BusyWatch(client, t_index)
+
+    def _wait_until_idle(
+        self,
+        t_index: int,
+        timeout_s: float,
+        timeout_message: str,
+        watch: _BusyWatch | None = None,
+    ) -> None:
+        """Wait for busy to clear, via the status stream when *watch* is given.
+
+        Like SG, an idle reading is only trusted once busy has been seen or
+        ``poll_interval_s`` has passed, since the device may not have raised
+        busy yet right after the command.
+        """
+        started = time.monotonic()
+        if watch is None:
+            seen = {"busy": False}
+
+            def _idle() -> bool:
+                if self.is_busy(t_index):
+                    seen["busy"] = True
+                    return False
+                return self._idle_is_settled(started, seen["busy"])
+
+            self._wait_until(_idle, timeout_s, timeout_message)
+            return
+        deadline = started + timeout_s
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not watch.idle.wait(timeout=remaining):
+                raise OnRobotTimeoutError(timeout_message)
+            if watch.seen_busy:
+                return
+            # An idle message with no busy one before it may be a snapshot taken
+            # before the motion started; confirm over XML-RPC before trusting it.
+            # Re-arm first so updates arriving during the read are not lost.
+            watch.idle.clear()
+            if self.is_busy(t_index):
+                continue
+            settle_s = started + self._policy.poll_interval_s - time.monotonic()
+            if settle_s > 0:
+                # Too early to tell; look again once the settle time has passed.
+                time.sleep(min(settle_s, max(0.0, deadline - time.monotonic())))
+                if watch.seen_busy:
+                    # Motion started meanwhile; wait for the idle update after it.
+                    continue
+                if self.is_busy(t_index):
+                    continue
+            return
+
+    def _idle_is_settled(self, started: float, seen_busy: bool) -> bool:
+        """Trust an idle reading once busy was seen or the settle time has passed."""
+        return seen_busy or time.monotonic() - started >= self._policy.poll_interval_s
+
+    def _read_busy_and_gripped(self, t_index: int = 0) -> tuple[bool, bool]:
+        self._require_connected(t_index)
+        results = self._multicall(
+            ("twofg_get_busy", t_index),
+            ("twofg_get_grip_detected", t_index),
+        )
+        if results is None:
+            results = self._call_xmlrpc_many(
+                ("twofg_get_busy", t_index),
+                ("twofg_get_grip_detected", t_index),
+            )
+        busy, gripped = results
+        return bool(busy), bool(gripped)
+
+    def _wait_for_grip(self, t_index: int, watch: _BusyWatch | None = None) -> None:
+        """Wait for the grip to settle and fail if no object was detected."""
+        timeout_s = self._policy.busy_timeout_s
+        if watch is not None:
+            self._wait_until_idle(t_index, timeout_s, "2FG grip command timeout", watch)
+            gripped = bool(self.is_gripped(t_index))
+        else:
+            started = time.monotonic()
+            state = {"gripped": False, "seen_busy": False}
+
+            def _settled() -> bool:
+                busy, state["gripped"] = self._read_busy_and_gripped(t_index)
+                if busy:
+                    state["seen_busy"] = True
+                    return False
+                return self._idle_is_settled(started, state["seen_busy"])
+
+            self._wait_until(_settled, timeout_s, "2FG grip command timeout")
+            gripped = state["gripped"]
+        if not gripped:
+            raise OnRobotError("2FG grip finished without detecting an object")
+
     def start_status_stream(self, on_update=None, timeout_s: float = 2.0) -> bool:
         if not self._cb_ip:
             return False
         if self._status_client is None:
-            from onrobot.status_client import OnRobotStatusClient
-
             self._status_client = OnRobotStatusClient(self._cb_ip, on_update=on_update)
         try:
             self._status_client.connect(timeout_s=timeout_s)
@@ -102,12 +387,15 @@ class TWOFG:
         if client is None:
             return
         client.disconnect()
+        self.invalidate_connection_cache()
 
     def get_status_snapshot(self, t_index: int = 0):
         client = self._status_client
         if client is None:
             return None
-        return client.get_device_variable(device_id=t_index, product_code=TWOFG_ID)
+        snapshot = client.get_device_variable(device_id=t_index, product_code=TWOFG_ID)
+        # The client shares its stored dict; hand callers their own copy.
+        return None if snapshot is None else dict(snapshot)
 
     def _safe_dimension_value(self, method_name: str, t_index: int = 0):
         try:
@@ -115,14 +403,15 @@ class TWOFG:
         except Exception:  # noqa: BLE001
             return None
 
-    def _normalize_finger_orientation(self, orientation):
+    @staticmethod
+    def _normalize_finger_orientation(orientation):
         if isinstance(orientation, bool):
             return orientation
         if isinstance(orientation, str):
             cleaned = orientation.strip().lower()
-            if cleaned in {"outward", "out", "outside"}:
+            if cleaned in _OUTWARD:
                 return True
-            if cleaned in {"inward", "in", "inside"}:
+            if cleaned in _INWARD:
                 return False
             return None
         if isinstance(orientation, (int, float)):
@@ -163,16 +452,23 @@ class TWOFG:
             resolved = self._normalize_finger_orientation(orientation)
         if resolved is None:
             raise OnRobotValidationError("Invalid finger orientation argument")
+        # Flipping the fingers changes the reachable width range.
+        self.invalidate_width_cache(t_index)
         try:
             self._call_xmlrpc("twofg_set_finger_orientation", t_index, float(resolved))
             return
-        except Exception:
-            pass
+        except xmlrpc.client.Fault as fault:
+            if fault.faultCode not in _METHOD_NOT_FOUND_FAULTS:
+                raise OnRobotError(
+                    f"Compute Box rejected finger orientation: {fault.faultString}"
+                ) from fault
+        except _TRANSPORT_ERRORS as exc:
+            raise OnRobotConnectionError("Unable to set finger orientation") from exc
         try:
             rest_value = "true" if resolved else "false"
             self._call_rest(f"api/dc/twofg/set_finger_orientation/{t_index}/{rest_value}")
             return
-        except (urllib.error.URLError, OnRobotConnectionError) as exc:
+        except (OSError, http.client.HTTPException, OnRobotConnectionError) as exc:
             raise OnRobotConnectionError("Unable to set finger orientation") from exc
 
     def set_finger_orientation(self, t_index=0, orientation=None, outward=None):
@@ -316,15 +612,32 @@ class TWOFG:
             return CONN_ERR
 
     def stop_operation(self, t_index: int = 0):
-        self._require_connected(t_index)
-        self._call_xmlrpc("twofg_stop", t_index)
+        # Emergency stop goes straight to the device; no connection pre-check.
+        try:
+            self._call_xmlrpc("twofg_stop", t_index)
+        except Exception as exc:  # noqa: BLE001
+            raise OnRobotConnectionError("Failed to send 2FG stop command") from exc
+        finally:
+            self.invalidate_connection_cache(t_index)
 
     def stop(self, t_index=0):
         try:
             self.stop_operation(t_index=t_index)
+            return RET_OK
         except OnRobotConnectionError:
             return CONN_ERR
 
+    def stop_nowait(self, t_index: int = 0) -> threading.Thread:
+        """Send the stop command from a background thread and return immediately."""
+        thread = threading.Thread(
+            target=self.stop,
+            args=(t_index,),
+            name="twofg-stop",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
     def grip_external(
         self,
         t_index: int = 0,
@@ -333,35 +646,31 @@ class TWOFG:
         p_speed: int = GRIPPER_PROFILE.speed_default,
         wait: bool = True,
     ) -> None:
-        self._require_connected(t_index)
-        max_width = self.get_max_external_width(t_index)
-        min_width = self.get_min_external_width(t_index)
+        min_width, max_width = self._prefetch_grip_prereqs(t_index)
         if t_width > max_width or t_width < min_width:
             raise OnRobotValidationError(
                 f"Invalid width {t_width}; valid range is {min_width}-{max_width}"
             )
-        profile = self._profile
-        if n_force > profile.force_max or n_force < profile.force_min:
+        if not (self._fmin <= n_force <= self._fmax):
+            profile = self._profile
             raise OnRobotValidationError(
                 f"Invalid force {n_force}; valid range is {profile.force_min}-{profile.force_max}"
             )
-        if p_speed > profile.speed_max or p_speed < profile.speed_min:
+        if not (self._smin <= p_speed <= self._smax):
+            profile = self._profile
             raise OnRobotValidationError(
                 f"Invalid speed {p_speed}; valid range is {profile.speed_min}-{profile.speed_max}"
             )
-        self._call_xmlrpc("twofg_grip_external", t_index, float(t_width), int(n_force), int(p_speed))
-        if not wait:
-            return
-        self._wait_until(
-            lambda: not bool(self.is_busy(t_index)),
-            self._policy.busy_timeout_s,
-            "2FG grip command timeout",
-        )
-        self._wait_until(
-            lambda: bool(self.is_gripped(t_index)),
-            self._policy.detect_timeout_s,
-            "2FG grip detection timeout",
-        )
+        watch = self._watch_busy(t_index) if wait else None
+        try:
+            self._call_xmlrpc(
+                "twofg_grip_external", t_index, float(t_width), int(n_force), int(p_speed)
+            )
+            if wait:
+                self._wait_for_grip(t_index, watch)
+        finally:
+            if watch is not None:
+                watch.close()
 
     def grip(
         self,
@@ -387,21 +696,21 @@ class TWOFG:
             return RET_FAIL
 
     def move_external(self, t_index: int, t_width: float = 20.0, wait: bool = True) -> None:
-        self._require_connected(t_index)
-        max_width = self.get_max_external_width(t_index)
-        min_width = self.get_min_external_width(t_index)
+        min_width, max_width = self._prefetch_grip_prereqs(t_index)
         if t_width > max_width or t_width < min_width:
             raise OnRobotValidationError(
                 f"Invalid width {t_width}; valid range is {min_width}-{max_width}"
             )
-        self._call_xmlrpc("twofg_grip_external", t_index, float(t_width), 100, 80)
-        if not wait:
-            return
-        self._wait_until(
-            lambda: not bool(self.is_busy(t_index)),
-            self._policy.busy_timeout_s,
-            "2FG move timeout",
-        )
+        watch = self._watch_busy(t_index) if wait else None
+        try:
+            self._call_xmlrpc("twofg_grip_external", t_index, float(t_width), 100, 80)
+            if wait:
+                self._wait_until_idle(
+                    t_index, self._policy.busy_timeout_s, "2FG move timeout", watch
+                )
+        finally:
+            if watch is not None:
+                watch.close()
 
     def move(self, t_index, t_width=20.0, f_wait=True):
         try:
@@ -14,6 +14,7 @@ from onrobot.errors import (
     OnRobotTimeoutError,
 )
 from onrobot.policies import OperationPolicy
+from onrobot.status_client import OnRobotStatusClient
 
 LOGGER = logging.getLogger(__name__)
 
@@ -95,8 +96,6 @@ class VG:
         if not self._cb_ip:
             return False
         if self._status_client is None:
-            from onrobot.status_client import OnRobotStatusClient
-
             self._status_client = OnRobotStatusClient(self._cb_ip, on_update=on_update)
         try:
             self._status_client.connect(timeout_s=timeout_s)
@@ -116,9 +115,10 @@ class VG:
         if client is None:
             return None
         snapshot = client.get_device_variable(device_id=t_index, product_code=VGC10_ID)
-        if snapshot is not None:
-            return snapshot
-        return client.get_device_variable(device_id=t_index, product_code=VG10_ID)
+        if snapshot is None:
+            snapshot = client.get_device_variable(device_id=t_index, product_code=VG10_ID)
+        # The client shares its stored dict; hand callers their own copy.
+        return None if snapshot is None else dict(snapshot)
 
     def isConnected(self, t_index=0):  # noqa: N802
         warnings.warn("isConnected() is deprecated; use is_connected().", DeprecationWarning, stacklevel=2)
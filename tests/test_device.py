@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import socket
+import time
+import xmlrpc.client
+
+import pytest
+
+from onrobot.device import Device, TimeoutTransport
+
+
+@pytest.mark.unit
+def test_compute_box_proxy_uses_configured_rpc_timeout() -> None:
+    device = Device("127.0.0.1", rpc_timeout_s=1.5)
+    proxy = device.get_compute_box()
+    transport = proxy("transport")
+
+    assert isinstance(transport, TimeoutTransport)
+    assert transport.timeout_s == 1.5
+
+
+@pytest.mark.unit
+def test_timeout_transport_gives_up_on_silent_compute_box() -> None:
+    # A listening socket that never answers stands in for a hung Compute Box.
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        proxy = xmlrpc.client.ServerProxy(
+            f"http://127.0.0.1:{server.getsockname()[1]}/",
+            transport=TimeoutTransport(0.2),
+        )
+
+        started = time.monotonic()
+        with pytest.raises(TimeoutError):
+            proxy.cb_is_device_connected(0, 0xC0)
+        assert time.monotonic() - started < 2.0
+
+
+@pytest.mark.unit
+def test_compute_box_proxy_blocks_by_default() -> None:
+    transport = Device("127.0.0.1").get_compute_box()("transport")
+
+    assert transport.timeout_s is None
@@ -81,3 +81,15 @@ def test_gripper_profile_options_are_sorted() -> None:
 
     assert keys == ["rg2", "sg", "twofg7", "vg10", "vgc10"]
     assert [option["value"] for option in options] == keys
+
+
+@pytest.mark.unit
+def test_gripper_profile_lookup_is_memoized() -> None:
+    get_gripper_profile.cache_clear()
+
+    first = get_gripper_profile("rg2")
+    second = get_gripper_profile("rg2")
+
+    assert first is second
+    assert get_gripper_profile.cache_info().hits == 1
+    assert get_gripper_profile(None) is get_gripper_profile("twofg7")
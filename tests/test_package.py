@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import onrobot
+
+
+@pytest.mark.unit
+def test_package_exports_load_submodules_on_first_access() -> None:
+    script = """
+import sys
+import onrobot
+assert 'onrobot.rg2' not in sys.modules
+assert 'onrobot.twofg' not in sys.modules
+from onrobot import TWOFG
+assert 'onrobot.twofg' in sys.modules
+assert 'onrobot.rg2' not in sys.modules
+assert sorted(onrobot.__all__) == sorted(name for name in onrobot.__all__ if hasattr(onrobot, name))
+"""
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+@pytest.mark.unit
+def test_package_export_lists_stay_in_sync() -> None:
+    assert set(onrobot._LAZY_EXPORTS) == set(onrobot.__all__)  # noqa: SLF001
+    assert len(onrobot.__all__) == len(set(onrobot.__all__))
+
+
+@pytest.mark.unit
+def test_package_dir_lists_resolved_exports_once() -> None:
+    from onrobot import TWOFG  # noqa: F401
+
+    names = dir(onrobot)
+    assert names.count("TWOFG") == 1
+    assert set(onrobot.__all__) <= set(names)
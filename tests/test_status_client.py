@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import json
 import subprocess
 import sys
+import threading
 
 import pytest
 
@@ -24,6 +26,17 @@ assert onrobot.Device is not None
     subprocess.run([sys.executable, "-c", script], check=True)
 
 
+@pytest.mark.unit
+def test_rpc_only_import_does_not_load_socketio() -> None:
+    script = """
+import sys
+from onrobot import TWOFG
+assert TWOFG is not None
+assert 'socketio' not in sys.modules
+"""
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
 @pytest.mark.unit
 def test_status_client_ignores_malformed_payloads() -> None:
     client = OnRobotStatusClient("127.0.0.1")
@@ -31,6 +44,29 @@ def test_status_client_ignores_malformed_payloads() -> None:
     assert client.latest_payload() == {}
 
 
+@pytest.mark.unit
+def test_status_client_tolerates_malformed_device_lists() -> None:
+    calls = {"count": 0}
+
+    def _on_update(payload):
+        calls["count"] += 1
+
+    client = OnRobotStatusClient("127.0.0.1", on_update=_on_update)
+    client._handle_message({"devices": None})  # noqa: SLF001
+    client._handle_message(  # noqa: SLF001
+        {
+            "devices": [
+                {"deviceId": [0], "productCode": 0xC0, "variable": {"width": 1}},
+                {"deviceId": 0, "productCode": 0xC0, "variable": {"width": 2}},
+            ]
+        }
+    )
+
+    assert calls["count"] == 2
+    assert client.latest_timestamp() is not None
+    assert client.get_device_variable(device_id=0, product_code=0xC0) == {"width": 2}
+
+
 @pytest.mark.unit
 def test_status_client_survives_callback_exceptions() -> None:
     calls = {"count": 0}
@@ -44,3 +80,48 @@ def test_status_client_survives_callback_exceptions() -> None:
     client._handle_message(payload)  # noqa: SLF001
     assert calls["count"] == 1
     assert client.get_device_variable(device_id=0, product_code=0xC0) == {"width": 10}
+
+
+@pytest.mark.unit
+def test_status_client_sets_waiter_event_when_predicate_matches() -> None:
+    client = OnRobotStatusClient("127.0.0.1")
+    event = threading.Event()
+    client.register_waiter(0, lambda variable: not variable.get("busy"), event, product_code=0xC0)
+
+    client._handle_message({"devices": [{"deviceId": 0, "productCode": 0xC0, "variable": {"busy": True}}]})  # noqa: SLF001
+    assert not event.is_set()
+    client._handle_message({"devices": [{"deviceId": 0, "productCode": 0xC0, "variable": {"busy": False}}]})  # noqa: SLF001
+    assert event.is_set()
+
+    client.unregister_waiter(event)
+    assert client._waiters == []  # noqa: SLF001
+
+
+@pytest.mark.unit
+def test_status_client_indexes_devices_by_id_and_product_code() -> None:
+    client = OnRobotStatusClient("127.0.0.1")
+    client._handle_message(  # noqa: SLF001
+        {
+            "devices": [
+                {"deviceId": 0, "productCode": 0x20, "variable": {"width": 1}},
+                {"deviceId": 0, "productCode": 0xC0, "variable": {"width": 2}},
+                {"deviceId": 1, "productCode": 0xC0, "variable": "bad"},
+            ]
+        }
+    )
+    assert client.get_device_variable(device_id=0, product_code=0xC0) == {"width": 2}
+    assert client.get_device_variable(device_id=0) == {"width": 1}
+    assert client.get_device_variable(device_id=1, product_code=0xC0) is None
+
+
+@pytest.mark.unit
+def test_status_client_snapshots_stay_plain_dicts() -> None:
+    client = OnRobotStatusClient("127.0.0.1")
+    client._handle_message(  # noqa: SLF001
+        {"devices": [{"deviceId": 0, "productCode": 0xC0, "variable": {"busy": True}}]}
+    )
+
+    snapshot = client.get_device_variable(device_id=0, product_code=0xC0)
+    assert type(snapshot) is dict
+    assert json.loads(json.dumps(snapshot)) == {"busy": True}
+    assert json.loads(json.dumps(client.latest_payload()))["devices"][0]["deviceId"] == 0
@@ -1,13 +1,38 @@
 from __future__ import annotations
 
+import threading
+import time
+import xmlrpc.client
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from xmlrpc.server import SimpleXMLRPCServer
+
 import pytest
 
-from onrobot.errors import OnRobotConnectionError, OnRobotValidationError
-from onrobot.twofg import CONN_ERR, RET_OK, TWOFG
+from onrobot.errors import OnRobotConnectionError, OnRobotError, OnRobotValidationError
+from onrobot.policies import OperationPolicy
+from onrobot.status_client import OnRobotStatusClient
+from onrobot.twofg import CONN_ERR, RET_FAIL, RET_OK, TWOFG
+
+
+class _FakeSystem:
+    """Serves ``system.multicall`` the way a Compute Box XML-RPC server does."""
+
+    def __init__(self, cb: _FakeCB) -> None:
+        self._cb = cb
+
+    def multicall(self, calls):  # noqa: ANN001, ANN201
+        results = []
+        for call in calls:
+            try:
+                results.append([getattr(self._cb, call["methodName"])(*call["params"])])
+            except xmlrpc.client.Fault as fault:
+                results.append({"faultCode": fault.faultCode, "faultString": fault.faultString})
+        return results
 
 
 class _FakeCB:
     def __init__(self) -> None:
+        self.system = _FakeSystem(self)
         self.connected = True
         self.busy = False
         self.gripped = True
@@ -87,3 +112,476 @@ def test_twofg_orientation_uses_compute_box_getter_name() -> None:
     gripper = TWOFG(_FakeDevice())
 
     assert gripper.get_finger_orientation_label() == "inward"
+
+
+@pytest.mark.unit
+def test_twofg_width_limits_are_cached_until_orientation_changes() -> None:
+    device = _FakeDevice()
+    calls = {"max": 0}
+    original = device.cb.twofg_get_max_external_width
+
+    def _counting_max(t_index):  # noqa: ANN001, ANN202
+        calls["max"] += 1
+        return original(t_index)
+
+    device.cb.twofg_get_max_external_width = _counting_max
+    device.cb.twofg_set_finger_orientation = lambda t_index, value: None
+    gripper = TWOFG(device)
+
+    assert gripper.grip(t_width=20.0) == RET_OK
+    assert gripper.move(0, t_width=30.0) == RET_OK
+    assert calls["max"] == 1
+
+    assert gripper.set_finger_orientation(orientation="outward") == RET_OK
+    assert gripper.grip(t_width=20.0) == RET_OK
+    assert calls["max"] == 2
+
+
+@pytest.mark.unit
+def test_twofg_connection_state_is_cached_briefly() -> None:
+    device = _FakeDevice()
+    calls = {"count": 0}
+    original = device.cb.cb_is_device_connected
+
+    def _counting_connected(t_index, device_id):  # noqa: ANN001, ANN202
+        calls["count"] += 1
+        return original(t_index, device_id)
+
+    device.cb.cb_is_device_connected = _counting_connected
+    gripper = TWOFG(device)
+
+    assert gripper.grip(t_width=20.0) == RET_OK
+    assert calls["count"] == 1
+
+    gripper.invalidate_connection_cache()
+    assert gripper.is_connected() is True
+    assert calls["count"] == 2
+
+
+@pytest.mark.unit
+def test_twofg_wait_backs_off_between_polls(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr("onrobot.twofg.time.sleep", sleeps.append)
+    gripper = TWOFG(_FakeDevice())
+    results = iter([False] * 6 + [True])
+
+    gripper._wait_until(lambda: next(results), 10.0, "timeout")  # noqa: SLF001
+
+    assert sleeps[0] == pytest.approx(0.02)
+    assert sleeps == sorted(sleeps)
+    assert max(sleeps) == pytest.approx(0.1)
+
+
+@pytest.mark.unit
+def test_twofg_wait_respects_tuned_poll_interval(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr("onrobot.twofg.time.sleep", sleeps.append)
+    gripper = TWOFG(_FakeDevice(), policy=OperationPolicy(poll_interval_s=0.01))
+    results = iter([False] * 3 + [True])
+
+    gripper._wait_until(lambda: next(results), 10.0, "timeout")  # noqa: SLF001
+
+    assert sleeps == [pytest.approx(0.01)] * 3
+
+
+@pytest.mark.unit
+def test_twofg_orientation_only_falls_back_to_rest_for_missing_method() -> None:
+    device = _FakeDevice()
+    rest_calls: list[str] = []
+    gripper = TWOFG(device)
+    gripper._call_rest = rest_calls.append  # noqa: SLF001
+
+    def _missing(t_index, value):  # noqa: ANN001, ANN202
+        raise xmlrpc.client.Fault(-32601, "method not found")
+
+    device.cb.twofg_set_finger_orientation = _missing
+    assert gripper.set_finger_orientation(orientation="outward") == RET_OK
+    assert rest_calls == ["api/dc/twofg/set_finger_orientation/0/true"]
+
+    def _rejected(t_index, value):  # noqa: ANN001, ANN202
+        raise xmlrpc.client.Fault(4, "busy")
+
+    device.cb.twofg_set_finger_orientation = _rejected
+    assert gripper.set_finger_orientation(orientation="inward") == RET_FAIL
+
+    def _unreachable(t_index, value):  # noqa: ANN001, ANN202
+        raise ConnectionRefusedError
+
+    device.cb.twofg_set_finger_orientation = _unreachable
+    assert gripper.set_finger_orientation(orientation="inward") == CONN_ERR
+    assert len(rest_calls) == 1
+
+
+@pytest.mark.unit
+def test_twofg_grip_prereqs_use_single_multicall_round_trip() -> None:
+    server = SimpleXMLRPCServer(("127.0.0.1", 0), logRequests=False, allow_none=True)
+    server.register_instance(_FakeCB())
+    server.register_multicall_functions()
+    requests: list[str] = []
+    original = server._dispatch  # noqa: SLF001
+
+    def _recording_dispatch(method, params):  # noqa: ANN001, ANN202
+        requests.append(method)
+        return original(method, params)
+
+    server._dispatch = _recording_dispatch  # noqa: SLF001
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        device = _FakeDevice()
+        device.cb = xmlrpc.client.ServerProxy(
+            f"http://127.0.0.1:{server.server_address[1]}/", allow_none=True
+        )
+        gripper = TWOFG(device)
+
+        assert gripper.grip(t_width=20.0) == RET_OK
+        # system.multicall dispatches its members through _dispatch too.
+        assert requests[:5] == [
+            "system.multicall",
+            "cb_is_device_connected",
+            "twofg_get_max_external_width",
+            "twofg_get_min_external_width",
+            "twofg_grip_external",
+        ]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.unit
+def test_twofg_grip_fails_without_waiting_when_idle_and_not_gripped() -> None:
+    device = _FakeDevice()
+    device.cb.gripped = False
+    gripper = TWOFG(device)
+
+    with pytest.raises(OnRobotError):
+        gripper.grip_external(t_width=20.0)
+    assert gripper.grip(t_width=20.0) == RET_FAIL
+
+
+@pytest.mark.unit
+def test_twofg_stop_skips_connection_check() -> None:
+    device = _FakeDevice()
+    stops: list[int] = []
+
+    def _not_expected(t_index, device_id):  # noqa: ANN001, ANN202
+        raise AssertionError("stop must not probe the connection")
+
+    device.cb.cb_is_device_connected = _not_expected
+    device.cb.twofg_stop = stops.append
+    gripper = TWOFG(device)
+
+    assert gripper.stop() == RET_OK
+    gripper.stop_nowait(t_index=1).join(timeout=1.0)
+    assert stops == [0, 1]
+
+    def _unreachable(t_index):  # noqa: ANN001, ANN202
+        raise ConnectionRefusedError
+
+    device.cb.twofg_stop = _unreachable
+    assert gripper.stop() == CONN_ERR
+
+
+def _connected_status_client() -> OnRobotStatusClient:
+    client = OnRobotStatusClient("127.0.0.1")
+    client.is_connected = lambda: True  # type: ignore[method-assign]
+    return client
+
+
+def _twofg_message(busy: bool) -> dict:
+    return {"devices": [{"deviceId": 0, "productCode": 0xC0, "variable": {"busy": busy}}]}
+
+
+@pytest.mark.unit
+def test_twofg_move_waits_for_busy_then_idle_on_status_stream() -> None:
+    device = _FakeDevice()
+    gripper = TWOFG(device)
+    client = _connected_status_client()
+    gripper._status_client = client  # noqa: SLF001
+    progress = {"idle_sent": False}
+
+    def _finish_motion() -> None:
+        time.sleep(0.05)
+        client._handle_message(_twofg_message(True))  # noqa: SLF001
+        device.cb.busy = False
+        progress["idle_sent"] = True
+        client._handle_message(_twofg_message(False))  # noqa: SLF001
+
+    def _grip_external(t_index, width, force, speed):  # noqa: ANN001, ANN202
+        device.cb.busy = True
+        threading.Thread(target=_finish_motion, daemon=True).start()
+
+    device.cb.twofg_grip_external = _grip_external
+
+    assert gripper.move(0, t_width=30.0) == RET_OK
+    assert progress["idle_sent"] is True
+    assert client._waiters == []  # noqa: SLF001
+
+
+@pytest.mark.unit
+def test_twofg_grip_ignores_stale_idle_message_on_status_stream() -> None:
+    device = _FakeDevice()
+    gripper = TWOFG(device)
+    client = _connected_status_client()
+    gripper._status_client = client  # noqa: SLF001
+    progress = {"idle_sent": False}
+
+    def _finish_motion() -> None:
+        time.sleep(0.05)
+        client._handle_message(_twofg_message(True))  # noqa: SLF001
+        device.cb.busy = False
+        progress["idle_sent"] = True
+        client._handle_message(_twofg_message(False))  # noqa: SLF001
+
+    def _grip_external(t_index, width, force, speed):  # noqa: ANN001, ANN202
+        device.cb.busy = True
+        device.cb.gripped = False
+
+        def _grip_then_finish() -> None:
+            time.sleep(0.01)
+            # Snapshot sampled before the fingers started moving.
+            client._handle_message(_twofg_message(False))  # noqa: SLF001
+            time.sleep(0.01)
+            device.cb.gripped = True
+            _finish_motion()
+
+        threading.Thread(target=_grip_then_finish, daemon=True).start()
+
+    device.cb.twofg_grip_external = _grip_external
+
+    assert gripper.grip(t_width=20.0) == RET_OK
+    assert progress["idle_sent"] is True
+
+
+class _RestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    peers: list[tuple[str, int]] = []
+    drop_after_response = False
+
+    def do_GET(self) -> None:  # noqa: N802
+        type(self).peers.append(self.client_address)
+        body = self.path.encode("utf-8")
+        self.send_response(404 if self.path.startswith("/missing") else 200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        # Silently drop the keep-alive socket, as an idle Compute Box does.
+        self.close_connection = type(self).drop_after_response
+
+    def log_message(self, format, *args) -> None:  # noqa: A002, ANN001
+        return None
+
+
+def _rest_gripper(drop_after_response: bool) -> tuple[TWOFG, ThreadingHTTPServer, type]:
+    handler = type(
+        "_Handler",
+        (_RestHandler,),
+        {"peers": [], "drop_after_response": drop_after_response},
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    device = _FakeDevice()
+    device.Global_cbip = f"127.0.0.1:{server.server_address[1]}"
+    return TWOFG(device), server, handler
+
+
+@pytest.mark.unit
+def test_twofg_rest_reuses_connection_and_maps_http_errors() -> None:
+    gripper, server, handler = _rest_gripper(drop_after_response=False)
+    try:
+        assert gripper._call_rest("api/one") == "/api/one"  # noqa: SLF001
+        assert gripper._call_rest("/api/two") == "/api/two"  # noqa: SLF001
+        assert len(set(handler.peers)) == 1
+        with pytest.raises(OnRobotConnectionError):
+            gripper._call_rest("missing")  # noqa: SLF001
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.unit
+def test_twofg_rest_reconnects_once_after_dropped_idle_socket() -> None:
+    gripper, server, handler = _rest_gripper(drop_after_response=True)
+    try:
+        assert gripper._call_rest("api/one") == "/api/one"  # noqa: SLF001
+        time.sleep(0.05)
+        assert gripper._call_rest("api/two") == "/api/two"  # noqa: SLF001
+        assert len(set(handler.peers)) == 2
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.unit
+def test_twofg_falls_back_to_single_calls_without_multicall() -> None:
+    device = _FakeDevice()
+
+    def _no_multicall(calls):  # noqa: ANN001, ANN202
+        raise xmlrpc.client.Fault(-32601, "system.multicall not found")
+
+    device.cb.system.multicall = _no_multicall
+    gripper = TWOFG(device)
+
+    assert gripper.grip(t_width=20.0) == RET_OK
+    assert gripper._multicall_supported is False  # noqa: SLF001
+    assert gripper.move(0, t_width=30.0) == RET_OK
+
+
+@pytest.mark.unit
+def test_twofg_multicall_member_fault_maps_to_connection_error() -> None:
+    device = _FakeDevice()
+
+    def _faulting_connected(t_index, device_id):  # noqa: ANN001, ANN202
+        raise xmlrpc.client.Fault(4, "device bus error")
+
+    device.cb.cb_is_device_connected = _faulting_connected
+    gripper = TWOFG(device)
+
+    with pytest.raises(OnRobotConnectionError):
+        gripper.grip_external(t_width=20.0)
+    assert gripper.grip(t_width=20.0) == CONN_ERR
+    assert gripper._multicall_supported is True  # noqa: SLF001
+
+
+@pytest.mark.unit
+def test_twofg_stream_wait_keeps_updates_received_during_busy_confirmation() -> None:
+    device = _FakeDevice()
+    gripper = TWOFG(device, policy=OperationPolicy(busy_timeout_s=1.0))
+    client = _connected_status_client()
+    gripper._status_client = client  # noqa: SLF001
+
+    def _grip_external(t_index, width, force, speed):  # noqa: ANN001, ANN202
+        def _stale_idle() -> None:
+            time.sleep(0.01)
+            client._handle_message(_twofg_message(False))  # noqa: SLF001
+
+        threading.Thread(target=_stale_idle, daemon=True).start()
+
+    def _busy_read(t_index):  # noqa: ANN001, ANN202
+        # The motion starts and finishes while the confirming read is in flight.
+        client._handle_message(_twofg_message(True))  # noqa: SLF001
+        client._handle_message(_twofg_message(False))  # noqa: SLF001
+        return True
+
+    device.cb.twofg_grip_external = _grip_external
+    device.cb.twofg_get_busy = _busy_read
+
+    started = time.monotonic()
+    assert gripper.move(0, t_width=30.0) == RET_OK
+    assert time.monotonic() - started < 0.5
+
+
+def _late_busy_grip(device: _FakeDevice, client: OnRobotStatusClient | None = None):  # noqa: ANN202
+    """Fake grip whose busy flag rises 10ms after the command and settles gripped."""
+
+    def _publish(busy: bool) -> None:
+        if client is not None:
+            client._handle_message(_twofg_message(busy))  # noqa: SLF001
+
+    def _motion() -> None:
+        if client is not None:
+            time.sleep(0.005)
+            # Snapshot sampled before the fingers started moving.
+            _publish(False)
+        time.sleep(0.01)
+        device.cb.busy = True
+        _publish(True)
+        time.sleep(0.3)
+        device.cb.gripped = True
+        device.cb.busy = False
+        _publish(False)
+
+    def _grip_external(t_index, width, force, speed):  # noqa: ANN001, ANN202
+        device.cb.busy = False
+        device.cb.gripped = False
+        threading.Thread(target=_motion, daemon=True).start()
+
+    return _grip_external
+
+
+@pytest.mark.unit
+def test_twofg_grip_waits_for_late_rising_busy_when_polling() -> None:
+    device = _FakeDevice()
+    device.cb.twofg_grip_external = _late_busy_grip(device)
+    gripper = TWOFG(device)
+
+    assert gripper.grip(t_width=20.0) == RET_OK
+
+
+@pytest.mark.unit
+def test_twofg_grip_waits_for_late_rising_busy_on_status_stream() -> None:
+    device = _FakeDevice()
+    client = _connected_status_client()
+    device.cb.twofg_grip_external = _late_busy_grip(device, client)
+    gripper = TWOFG(device)
+    gripper._status_client = client  # noqa: SLF001
+
+    assert gripper.grip(t_width=20.0) == RET_OK
+
+
+@pytest.mark.unit
+def test_twofg_move_waits_for_late_rising_busy_when_polling() -> None:
+    device = _FakeDevice()
+    device.cb.twofg_grip_external = _late_busy_grip(device)
+    gripper = TWOFG(device)
+
+    assert gripper.move(0, t_width=30.0) == RET_OK
+    assert device.cb.busy is False
+
+
+@pytest.mark.unit
+def test_twofg_status_snapshot_is_a_private_copy() -> None:
+    gripper = TWOFG(_FakeDevice())
+    client = OnRobotStatusClient("127.0.0.1")
+    gripper._status_client = client  # noqa: SLF001
+    client._handle_message(_twofg_message(True))  # noqa: SLF001
+
+    snapshot = gripper.get_status_snapshot()
+    snapshot["busy"] = False
+
+    assert gripper.get_status_snapshot() == {"busy": True}
+
+
+def _device_with_multicall(supported: bool) -> _FakeDevice:
+    device = _FakeDevice()
+    if not supported:
+
+        def _no_multicall(calls):  # noqa: ANN001, ANN202
+            raise xmlrpc.client.Fault(-32601, "system.multicall not found")
+
+        device.cb.system.multicall = _no_multicall
+    return device
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("multicall", [True, False])
+@pytest.mark.parametrize("method_name", ["twofg_get_max_external_width", "twofg_get_grip_detected"])
+def test_twofg_device_fault_is_ret_fail_with_or_without_multicall(
+    multicall: bool, method_name: str
+) -> None:
+    device = _device_with_multicall(multicall)
+
+    def _fault(t_index):  # noqa: ANN001, ANN202
+        raise xmlrpc.client.Fault(4, "device error")
+
+    setattr(device.cb, method_name, _fault)
+    gripper = TWOFG(device)
+
+    with pytest.raises(OnRobotError) as excinfo:
+        gripper.grip_external(t_width=20.0)
+    assert not isinstance(excinfo.value, OnRobotConnectionError)
+    assert gripper.grip(t_width=20.0) == RET_FAIL
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("multicall", [True, False])
+def test_twofg_transport_error_is_conn_err_with_or_without_multicall(multicall: bool) -> None:
+    device = _device_with_multicall(multicall)
+
+    def _reset(t_index):  # noqa: ANN001, ANN202
+        raise ConnectionResetError
+
+    device.cb.twofg_get_grip_detected = _reset
+    gripper = TWOFG(device)
+
+    assert gripper.grip(t_width=20.0) == CONN_ERR